@@ -1,19 +1,24 @@
 import argparse
 import json
 import math
+import os
+import time
 import numpy as np
 from objects import Scene, Camera, Vector, Material, Sphere, Plane, Light, Ray, Box, Cone
 from PIL import Image
+from typing import Optional
 
 class Raytracer:
-    def __init__(self, scene: Scene, width: int, height: int):
+    def __init__(self, scene: Scene, width: int, height: int, camera: Optional[Camera] = None):
         self.height = height
         self.width = width
         self.scene = scene
+        # Kamera widoku - domyślnie kamera ze sceny
+        self.camera = camera if camera is not None else scene.camera
 
     def render(self, ray_per_pixel: int, fovea_center: tuple[int, int]) -> np.ndarray:
         image = np.zeros((self.height, self.width, 3), dtype=np.float32)
-        camera = self.scene.camera
+        camera = self.camera
 
         view_height = 2 * np.tan(np.radians(camera.fov / 2))
         view_width = view_height * camera.aspect_ratio
@@ -136,7 +141,7 @@ class Raytracer:
             color = color + diffuse
 
             # Specular
-            view_dir = (self.scene.camera.position - hit.point).normalize()
+            view_dir = (self.camera.position - hit.point).normalize()
             reflect_dir = self.reflect(light_dir * -1, hit.normal)
             spec = max(0, view_dir.dot(reflect_dir)) ** hit.material.shininess
             specular = Vector(1, 1, 1) * hit.material.specular * spec * light.intensity
@@ -218,6 +223,73 @@ def load_scene(path: str) -> Scene:
     return scene
 
 
+class View:
+    def __init__(self, camera: Camera, fovea_center: tuple[int, int], name: str = ""):
+        self.camera = camera
+        self.fovea_center = fovea_center
+        self.name = name
+
+
+def make_stereo_views(camera: Camera, eye_separation: float,
+                      fovea_left: tuple[int, int], fovea_right: tuple[int, int]) -> list[View]:
+    # Oczy przesunięte wzdłuż osi "right" kamery, z równoległymi osiami widzenia
+    offset = camera.right * (eye_separation / 2)
+
+    def eye_camera(shift: Vector) -> Camera:
+        return Camera(
+            position=camera.position + shift,
+            look_at=camera.look_at + shift,
+            up=camera.up,
+            fov=camera.fov,
+            aspect_ratio=camera.aspect_ratio
+        )
+
+    return [
+        View(eye_camera(offset * -1), fovea_left, "left"),
+        View(eye_camera(offset), fovea_right, "right")
+    ]
+
+
+def render_views(scene: Scene, views: list[View], width: int, height: int,
+                 ray_per_pixel: int) -> tuple[list[np.ndarray], dict]:
+    # Wszystkie widoki korzystają z tej samej, raz wczytanej sceny.
+    # Poza sceną nic nie jest współdzielone - cienie i oświetlenie liczone są osobno dla każdego widoku
+    images = []
+    start_time = time.perf_counter()
+    for view in views:
+        print(f"Rendering view '{view.name}'")
+        raytracer = Raytracer(scene, width, height, camera=view.camera)
+        images.append(raytracer.render(ray_per_pixel, view.fovea_center))
+    render_time = time.perf_counter() - start_time
+
+    report = {
+        "views": len(views),
+        "scene_loads": 1,
+        # Tyle razy scena byłaby wczytana przy osobnych uruchomieniach dla każdego widoku
+        "independent_scene_loads": len(views),
+        "render_time": render_time
+    }
+
+    return images, report
+
+
+def side_by_side(images: list[np.ndarray]) -> np.ndarray:
+    return np.concatenate(images, axis=1)
+
+
+def save_image(image: np.ndarray, path: str):
+    image_uint8 = (image * 255).astype(np.uint8)
+    Image.fromarray(image_uint8).save(path)
+
+
+def print_report(report: dict):
+    print("Multi-view render report:")
+    print(f"  Views: {report['views']}")
+    print(f"  Scene loads: {report['scene_loads']} (independent runs: {report['independent_scene_loads']})")
+    print("  Shared between views: loaded scene only")
+    print(f"  Render time: {report['render_time']:.2f} s")
+
+
 def main(args_list=None):
     parser = argparse.ArgumentParser()
     parser.add_argument('--scene', type=str, required=True, help='Plik sceny JSON')
@@ -229,9 +301,46 @@ def main(args_list=None):
     parser.add_argument('--fovea_x', type=int, default=400, help='Współrzędna X środka ostrości')
     parser.add_argument('--fovea_y', type=int, default=300, help='Współrzędna Y środka ostrości')
 
+    # Renderowanie stereo (VR): drugie oko z własnym środkiem fovea
+    parser.add_argument('--eye_separation', type=float, default=0.0, help='Rozstaw oczu; > 0 włącza renderowanie stereo')
+    parser.add_argument('--fovea_right_x', type=int, default=None, help='Współrzędna X środka ostrości prawego oka')
+    parser.add_argument('--fovea_right_y', type=int, default=None, help='Współrzędna Y środka ostrości prawego oka')
+    parser.add_argument('--side_by_side', action='store_true', help='Zapisz oba widoki obok siebie w jednym pliku')
+
     args = parser.parse_args(args_list)
+    if args.eye_separation < 0:
+        parser.error('--eye_separation must be >= 0')
+    if args.eye_separation == 0:
+        stereo_only = [
+            name for name, value in (
+                ('--side_by_side', args.side_by_side),
+                ('--fovea_right_x', args.fovea_right_x is not None),
+                ('--fovea_right_y', args.fovea_right_y is not None)
+            ) if value
+        ]
+        if stereo_only:
+            parser.error(f"{', '.join(stereo_only)} require --eye_separation > 0")
 
     scene = load_scene(args.scene)
+
+    if args.eye_separation > 0:
+        fovea_left = (args.fovea_x, args.fovea_y)
+        fovea_right = (
+            args.fovea_right_x if args.fovea_right_x is not None else args.fovea_x,
+            args.fovea_right_y if args.fovea_right_y is not None else args.fovea_y
+        )
+        views = make_stereo_views(scene.camera, args.eye_separation, fovea_left, fovea_right)
+        images, report = render_views(scene, views, args.width, args.height, args.rays)
+        print_report(report)
+
+        if args.side_by_side:
+            save_image(side_by_side(images), args.output)
+        else:
+            root, ext = os.path.splitext(args.output)
+            for view, image in zip(views, images):
+                save_image(image, f"{root}_{view.name}{ext}")
+        return
+
     raytracer = Raytracer(scene, args.width, args.height)
 
     # Przekazujemy współrzędne środka (X, Y) do renderera
@@ -240,8 +349,7 @@ def main(args_list=None):
         fovea_center=(args.fovea_x, args.fovea_y)
     )
 
-    image_uint8 = (image * 255).astype(np.uint8)
-    Image.fromarray(image_uint8).save(args.output)
+    save_image(image, args.output)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import numpy as np
+import pytest
+from PIL import Image
+import scene_loader
+from scene_loader import Raytracer, View, load_scene, make_stereo_views, render_views, side_by_side
+
+SCENE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scene.json")
+WIDTH = 16
+HEIGHT = 12
+
+
+@pytest.fixture
+def scene():
+    return load_scene(SCENE_PATH)
+
+
+def test_single_view_output_unchanged(scene):
+    np.random.seed(0)
+    image = Raytracer(scene, WIDTH, HEIGHT).render(2, (8, 6))
+    assert image.shape == (HEIGHT, WIDTH, 3)
+
+    np.random.seed(0)
+    images, _ = render_views(scene, [View(scene.camera, (8, 6))], WIDTH, HEIGHT, 2)
+    np.testing.assert_array_equal(images[0], image)
+
+
+def test_stereo_eye_cameras_offset_along_right(scene):
+    camera = scene.camera
+    left, right = make_stereo_views(camera, 0.064, (4, 6), (12, 6))
+
+    for view, sign in ((left, -1), (right, 1)):
+        offset = view.camera.position - camera.position
+        expected = camera.right * (sign * 0.032)
+        assert offset.to_array() == pytest.approx(expected.to_array())
+        assert view.camera.forward.to_array() == pytest.approx(camera.forward.to_array())
+
+    assert left.fovea_center == (4, 6)
+    assert right.fovea_center == (12, 6)
+
+
+def test_side_by_side_width(scene):
+    views = make_stereo_views(scene.camera, 0.064, (8, 6), (8, 6))
+    images, _ = render_views(scene, views, WIDTH, HEIGHT, 1)
+    frame = side_by_side(images)
+    assert frame.shape == (HEIGHT, 2 * WIDTH, 3)
+
+
+def test_report_states_shared_work(scene):
+    views = make_stereo_views(scene.camera, 0.064, (8, 6), (8, 6))
+    _, report = render_views(scene, views, WIDTH, HEIGHT, 1)
+
+    assert report["views"] == 2
+    assert report["scene_loads"] == 1
+    assert report["independent_scene_loads"] == 2
+    assert report["render_time"] >= 0
+
+
+def test_cli_stereo_side_by_side(tmp_path):
+    output = tmp_path / "vr.png"
+    scene_loader.main([
+        '--scene', SCENE_PATH, '--output', str(output),
+        '--width', str(WIDTH), '--height', str(HEIGHT), '--rays', '1',
+        '--fovea_x', '8', '--fovea_y', '6',
+        '--eye_separation', '0.064', '--side_by_side'
+    ])
+    assert Image.open(output).size == (2 * WIDTH, HEIGHT)
+
+
+@pytest.mark.parametrize("extra_args", [
+    ['--eye_separation', '-0.064'],
+    ['--side_by_side'],
+    ['--fovea_right_x', '8'],
+    ['--fovea_right_y', '6'],
+    ['--eye_separation', '0', '--side_by_side']
+])
+def test_cli_rejects_stereo_options_without_stereo(tmp_path, extra_args):
+    output = tmp_path / "vr.png"
+    with pytest.raises(SystemExit):
+        scene_loader.main(['--scene', SCENE_PATH, '--output', str(output)] + extra_args)
+    assert not output.exists()